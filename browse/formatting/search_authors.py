@@ -12,6 +12,9 @@ the author list.
 
 """
 
+_PREFIX_RE = re.compile('^(' + PREFIX_MATCH + ')$', re.IGNORECASE)
+"""Surname prefixes like van or de, built once rather than per name."""
+
 
 def is_affiliation(item: str) -> bool:
     """Return true if a string contains an affiliation."""
@@ -103,7 +106,7 @@ def queries_for_authors(authors: str) -> AuthorList:
         elif is_short(item) or is_etal(item):
             out.append(item)
         else:
-            out = [*out, *_link_for_name_or_collab(item)]
+            out.extend(_link_for_name_or_collab(item))
 
     return out
 
@@ -159,8 +162,7 @@ def _link_for_name_or_collab(item: str) -> AuthorList:
             name_bit_count += 1
 
             if (found_prefix or (name_bit_count > 1
-                                 and re.match('^(' + PREFIX_MATCH + ')$',
-                                              name_bit, re.IGNORECASE))):
+                                 and _PREFIX_RE.match(name_bit))):
                 surname_prefixes.append(name_bit)
                 found_prefix = True
             else:
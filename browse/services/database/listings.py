@@ -1,12 +1,17 @@
-from datetime import  datetime
+from datetime import  date, datetime
+from functools import lru_cache
+from itertools import chain
+import sys
+import time
 from dateutil.tz import gettz
-from typing import List, Optional, Tuple, Set, Union
+from typing import Dict, Iterable, List, Literal, Optional, Tuple, Set, Union
 
-from sqlalchemy import case, distinct, or_, and_, desc
+from sqlalchemy import ColumnElement, Integer, Select, String, bindparam, case, distinct, or_, and_, desc, select
 from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.sql import func
+from sqlalchemy.sql.elements import BindParameter
 from sqlalchemy.engine import Row
-from sqlalchemy.orm import aliased, load_only
+from sqlalchemy.orm import Mapped, aliased, load_only, raiseload
 
 from browse.services.listing import (
     MonthCount,
@@ -36,7 +41,6 @@ tz = gettz(app_config.get("ARXIV_BUSINESS_TZ"))
 def get_new_listing(archive_or_cat: str,skip: int, show: int) -> ListingNew:
     "gets the most recent day of listings for an archive or category"
 
-    category_list=_all_possible_categories(archive_or_cat)
     archives, cats=_request_categories(archive_or_cat)
 
     up=aliased(Updates)
@@ -59,7 +63,7 @@ def get_new_listing(archive_or_cat: str,skip: int, show: int) -> ListingNew:
         .filter(up.date==recent_date)
         .filter(up.version<6)
         .filter(up.action!="absonly")
-        .filter(up.category.in_(category_list))
+        .filter(_category_filter(up.category, archive_or_cat))
         .group_by(up.document_id) #one listings per paper
         .order_by(case_order) #action kept chosen by priority if multiple
         .subquery() 
@@ -162,7 +166,9 @@ def get_new_listing(archive_or_cat: str,skip: int, show: int) -> ListingNew:
             meta.modtime,
             meta.abstract,
             raiseload= True
-            ))
+            ),
+            raiseload('*') #listings must not lazy load relationships
+        )
         .all() 
     )
 
@@ -189,7 +195,6 @@ def get_new_listing(archive_or_cat: str,skip: int, show: int) -> ListingNew:
 
 def get_recent_listing(archive_or_cat: str,skip: int, show: int) -> Listing:
 
-    category_list=_all_possible_categories(archive_or_cat)
     archives, cats=_request_categories(archive_or_cat)
     up=aliased(Updates)
     dates = (
@@ -206,7 +211,7 @@ def get_recent_listing(archive_or_cat: str,skip: int, show: int) -> Listing:
         )
         .filter(up.date.in_(dates.select()))
         .filter(or_(up.action=="new", up.action=="cross"))
-        .filter(up.category.in_(category_list))
+        .filter(_category_filter(up.category, archive_or_cat))
         .group_by(up.document_id) #one listing per paper
         .subquery() 
     )
@@ -273,7 +278,9 @@ def get_recent_listing(archive_or_cat: str,skip: int, show: int) -> Listing:
             meta.version,
             meta.modtime,
             raiseload= True
-            ))
+            ),
+            raiseload('*') #listings must not lazy load relationships
+        )
         .all()
     )
 
@@ -314,45 +321,82 @@ def get_articles_for_month(
     Searches for all possible category names that could apply to a particular archive or category
     also retrieves information on if any of the possible categories is the articles primary
     """
+    #paper_ids in right time frame
+    id_style: Literal["new", "old", "both"]
+    if month: #for monthly listings
+        date_part=f"{year % 100:02d}{month:02d}"
+        if year > 2007: #new ids
+            id_style="new"
+        elif year < 2007: #old ids
+            id_style="old"
+        else: #2007 splits in april
+            id_style="old" if month<4 else "new"
+
+    else: #for yearly listings   
+        date_part=f"{year % 100:02d}"
+        if year > 2007: #new ids
+            id_style="new"
+        elif year < 2007: #old ids
+            id_style="old"
+        else: #both styles present
+            id_style="both"
+
+    rows, count_query=_month_listing_statements(archive_or_cat, id_style)
+    params={"date_part": date_part, "skip": skip, "show": show}
+    #rows are streamed into listing items in batches rather than all fetched first
+    #the result is closed even if building an item fails so the streamed cursor is not left open on the connection
+    with Session.execute(rows, params, execution_options={"yield_per": 200}) as result:
+        first=result.fetchone()
+        listings=_entries_into_monthly_listing_items(chain([first], result)) if first is not None else []
+    if first is not None:
+        count=first.total
+    elif skip>0: #paged past the end, still need the total
+        count=Session.execute(count_query, params).scalar_one()
+    else:
+        count=0
+
+    if not month: month=1 #yearly listings need a month for datetime
+
+    return Listing(
+        listings=listings,
+        pubdates=[(datetime(year, month, 1), 1)],  # only used for display month
+        count=count,
+        expires=gen_expires(),
+    )
+
+@lru_cache(maxsize=1024)
+def _month_listing_statements(archive_or_cat: str, id_style: Literal["new", "old", "both"]) -> Tuple[Select, Select]:
+    """statements for get_articles_for_month: the page of listings, and the total for when the page is empty
+    built once per subject and id style, everything else is a bind parameter so the compiled sql is reused:
+    date_part is YYMM or YY, skip and show
+    """
     archives, cats=_request_categories(archive_or_cat)
     
     doc = aliased(Document)
     meta = aliased(Metadata)
     aic = aliased(t_arXiv_in_category)
 
+    date_part=bindparam("date_part", type_=String)
+    if id_style=="new":
+        id_filter=doc.paper_id.startswith(date_part)
+    elif id_style=="old":
+        id_filter=_old_id_prefix(doc.paper_id, date_part)
+    else:
+        id_filter=or_(
+            doc.paper_id.startswith(date_part),
+            _old_id_prefix(doc.paper_id, date_part)
+        )
+
     """
     retrieves the max value for is_primary over all searched for categories per document
     this results in one entry per document with a value of 1 if any of the requested categories is the primary and 0 otherwise
     """
-
-    #gets document_ids of paper_ids in right time frame
-    starter=Session.query(doc.document_id)
-    if month: #for monthly listings
-        if year > 2007: #new ids
-            doc_ids=starter.filter(doc.paper_id.startswith(f"{year % 100:02d}{month:02d}"))
-        elif year < 2007: #old ids (slow)
-            doc_ids=starter.filter(doc.paper_id.like(f"%/{year % 100:02d}{month:02d}%"))
-        else: #2007 splits in april
-            if month<4:
-                doc_ids=starter.filter(doc.paper_id.like(f"%/{year % 100:02d}{month:02d}%"))
-            else:
-                doc_ids=starter.filter(doc.paper_id.startswith(f"{year % 100:02d}{month:02d}"))
-
-    else: #for yearly listings   
-        if year > 2007: #new ids
-            doc_ids=starter.filter(doc.paper_id.startswith(f"{year % 100:02d}"))
-        elif year < 2007: #old ids (slow)
-            doc_ids=starter.filter(doc.paper_id.like(f"%/{year % 100:02d}%"))
-        else: #both styles present
-            doc_ids=starter.filter(
-                (doc.paper_id.startswith(f"{year % 100:02d}"))
-                | (doc.paper_id.like(f"%/{year % 100:02d}%"))
-            )                     
-  
     cat_conditions = [and_(aic.c.archive == arch_part, aic.c.subject_class == subj_part) for arch_part, subj_part in cats]
     #filters to only the ones in the right category and records if any of the requested categories are primary
-    cat_query = (Session.query(aic.c.document_id, func.max(aic.c.is_primary).label('is_primary'))
-        .where(aic.c.document_id.in_(doc_ids))
+    #joined to the documents so the optimizer can choose which side to drive from
+    cat_query = (select(aic.c.document_id, func.max(aic.c.is_primary).label('is_primary'))
+        .join(doc, doc.document_id == aic.c.document_id)
+        .where(id_filter)
         .where(
             or_(
                 aic.c.archive.in_(archives),
@@ -363,20 +407,18 @@ def get_articles_for_month(
         .subquery()
     )
 
-    #gets the metadata for applicable documents
-    main_query=(Session.query(meta, cat_query.c.is_primary)
+    #applicable documents, only counted when paging past the end
+    count_query=(select(func.count())
         .select_from(
             cat_query.join(meta, meta.document_id==cat_query.c.document_id)
             )
-        .filter(meta.is_current == 1)
+        .where(meta.is_current == 1)
     )
 
-    rows=( 
-        main_query.order_by(cat_query.c.is_primary.desc(), meta.paper_id)
-        .offset(skip)
-        .limit(show)
-        .options(load_only(
-            meta.document_id,
+    #new listings then cross listings, one pass over the documents with the total count on each row
+    #plain column rows, listings are read only so there is no need to build ORM objects
+    rows=(
+        select(
             meta.paper_id,
             meta.updated,
             meta.source_flags,
@@ -387,27 +429,33 @@ def get_articles_for_month(
             meta.journal_ref,
             meta.version,
             meta.modtime,
-            raiseload= True
-            ))
+            cat_query.c.is_primary,
+            func.count().over().label('total')
         )
-    
-    result=rows.all() #get listings to display
-    count=main_query.count() #get total entries 
-    new_listings, cross_listings = _entries_into_monthly_listing_items(result)
-
-    if not month: month=1 #yearly listings need a month for datetime
-
-    return Listing(
-        listings=new_listings + cross_listings,
-        pubdates=[(datetime(year, month, 1), 1)],  # only used for display month
-        count=count,
-        expires=gen_expires(),
+        .select_from(
+            cat_query.join(meta, meta.document_id==cat_query.c.document_id)
+        )
+        .where(meta.is_current == 1)
+        .order_by(cat_query.c.is_primary.desc(), meta.paper_id)
+        .offset(bindparam("skip", type_=Integer))
+        .limit(bindparam("show", type_=Integer))
     )
+    return rows, count_query
+
+@lru_cache(maxsize=4096)
+def _split_abs_categories(abs_categories: Optional[str]) -> Tuple[Category, Tuple[Category, ...]]:
+    """primary and secondary categories of an abs_categories string.
+    the same category strings repeat across many papers so each one is only split and looked up once
+    """
+    if not abs_categories:
+        return CATEGORIES["bad-arch.bad-cat"], ()
+    cats=abs_categories.split()
+    return CATEGORIES[cats[0]], tuple(CATEGORIES[sc] for sc in cats[1:])
 
-def _metadata_to_listing_item(meta: Metadata, type: AnnounceTypes) -> ListingItem:
+def _metadata_to_listing_item(meta: Union[Metadata, Row], type: AnnounceTypes) -> ListingItem:
     """"turns rows of document and category into a underfilled version of DocMetadata.
     Underfilled to match the behavior of fs_listings, omits data not needed for listing items
-    meta: the metadata for an item 
+    meta: the metadata for an item, either the ORM object or a row with the same column names
     type: the type of announcement "new" "cross" or "rep" """
     updated=meta.updated
     modtime=meta.modtime
@@ -420,14 +468,8 @@ def _metadata_to_listing_item(meta: Metadata, type: AnnounceTypes) -> ListingIte
     elif updated is not None and modtime is None:
         modified=updated
 
-    if meta.abs_categories:
-        primary_cat=CATEGORIES[meta.abs_categories.split()[0]]
-        secondary_cats= [
-            CATEGORIES[sc] for sc in meta.abs_categories.split()[1:]
-        ]
-    else:
-        primary_cat=CATEGORIES["bad-arch.bad-cat"]
-        secondary_cats=[]
+    primary_cat, secondary_cats=_split_abs_categories(meta.abs_categories)
+    primary_archive=primary_cat.get_archive()
 
     try: #incase abstract wasnt loaded
         abstract=getattr(meta, 'abstract','') 
@@ -442,7 +484,7 @@ def _metadata_to_listing_item(meta: Metadata, type: AnnounceTypes) -> ListingIte
         abstract= abstract,
         categories= getattr(meta, 'abs_categories',""),
         primary_category=primary_cat,
-        secondary_categories=secondary_cats,
+        secondary_categories=list(secondary_cats),
         comments=meta.comments,
         journal_ref=meta.journal_ref,
         version=meta.version,
@@ -458,8 +500,8 @@ def _metadata_to_listing_item(meta: Metadata, type: AnnounceTypes) -> ListingIte
         raw_safe="",
         submitter=None, # type: ignore
         arxiv_identifier=None, # type: ignore
-        primary_archive=primary_cat.get_archive(), 
-        primary_group=primary_cat.get_archive().get_group(), 
+        primary_archive=primary_archive, 
+        primary_group=primary_archive.get_group(), 
         modified=modified
     )
     item = ListingItem(
@@ -471,30 +513,23 @@ def _metadata_to_listing_item(meta: Metadata, type: AnnounceTypes) -> ListingIte
     return item
 
 def _entries_into_monthly_listing_items(
-    query_result: List[Tuple[Metadata, int]]
-) -> Tuple[List[ListingItem], List[ListingItem]]:
+    query_result: Iterable[Row]
+) -> List[ListingItem]:
     """ monthly and yearly listings only show new articles, 
     and new articles crosslisted into the category
+    rows hold the listing columns of the metadata and is_primary
+    the query already orders new listings before crosslists so that order is kept
     """
-    new_listings = []
-    cross_listings = []
-    for entry in query_result:
-        meta, primary = entry
-        meta.abstract="" #protects from a db call to load an unneeded abstract
-        if primary==1:
-            list_type="new"
-        else:
-            list_type="cross"
-
-        item=_metadata_to_listing_item(meta,list_type) #type:ignore
-
-        if primary == 1:  # new listings go before crosslists
-            new_listings.append(item)
-        else:  # new listings go before crosslists
-            cross_listings.append(item)
+    return [
+        _metadata_to_listing_item(row, "new" if row.is_primary == 1 else "cross")
+        for row in query_result
+    ]
 
-    return new_listings, cross_listings
 
+#alias or subsumed archive name for each category that has one, Category.alt_name worked out once
+_ALT_NAMES: Dict[str, str] = {
+    cat_id: sys.intern(cat.alt_name) for cat_id, cat in CATEGORIES.items() if cat.alt_name
+}
 
 def process_requested_subject(subject: Union[Group, Archive, Category])-> Tuple[Set[str], Set[Tuple[str,str]]]:
     """ 
@@ -518,102 +553,159 @@ def process_requested_subject(subject: Union[Group, Archive, Category])-> Tuple[
     #handle category request
     if isinstance(subject, Category):
         process_cat_name(subject.id)
-        if subject.alt_name:
-            process_cat_name(subject.alt_name)
+        if subject.id in _ALT_NAMES:
+            process_cat_name(_ALT_NAMES[subject.id])
 
     elif isinstance(subject, Archive):
         archs.add(subject.id)
         for category in subject.get_categories(True):
-            process_cat_name(category.alt_name) if category.alt_name else None 
+            process_cat_name(_ALT_NAMES[category.id]) if category.id in _ALT_NAMES else None 
 
     elif isinstance(subject, Group):
         for arch in subject.get_archives(True):
             archs.add(arch.id)
         for arch in subject.get_archives(True): #twice to avoid adding cateogires covered by archives
             for category in arch.get_categories(True):
-                process_cat_name(category.alt_name) if category.alt_name else None 
+                process_cat_name(_ALT_NAMES[category.id]) if category.id in _ALT_NAMES else None 
 
     return archs, cats
 
 
-def _request_categories(archive_or_cat:str) -> Tuple[List[str],List[Tuple[str,str]]]:
-    """ list of archives to search if appliable, 
-    list of tuples are the categories to check for (possibly in addition to the archive) broken into archvie and category parts
+def _request_categories(archive_or_cat:str) -> Tuple[Tuple[str, ...],Tuple[Tuple[str,str], ...]]:
+    """ archives to search if appliable, 
+    tuples are the categories to check for (possibly in addition to the archive) broken into archvie and category parts
     if a category is received, return the category and possible alternate names
-    if an archive is received return the archive name and a list of all categories that should be included but arent nominally part of the archive 
+    if an archive is received return the archive name and all categories that should be included but arent nominally part of the archive 
     """
-    if archive_or_cat in ARCHIVES:
-        arch, cats=process_requested_subject(ARCHIVES[archive_or_cat])
-    elif archive_or_cat in CATEGORIES:
-        arch, cats=process_requested_subject(CATEGORIES[archive_or_cat])
- 
-    return list(arch), list(cats)
+    try:
+        return _REQUEST_CATEGORIES[archive_or_cat]
+    except KeyError:
+        raise BadRequest(f'Invalid category: {archive_or_cat}')
 
-def _all_possible_categories(archive_or_cat:str) -> List[str]:
-    """returns a list of all categories in an archive, or all possible alternate names for categories
+def _all_possible_categories(archive_or_cat:str) -> Tuple[str, ...]:
+    """returns all categories in an archive, or all possible alternate names for categories
     takes into account aliases and subsumed archives
     should not return newer names for subsumed archives
     """
+    try:
+        return _POSSIBLE_CATEGORIES[archive_or_cat]
+    except KeyError:
+        raise BadRequest(f'Invalid category: {archive_or_cat}')
+
+def _possible_categories_for(archive_or_cat:str) -> Tuple[str, ...]:
+    """walks the taxonomy for _all_possible_categories, only run when building the lookup"""
     if archive_or_cat in ARCHIVES: #get all categories for archive
         archive=ARCHIVES[archive_or_cat]
         all=set()
         for category in archive.get_categories(True):
             all.add(category.id)
-            if category.alt_name:
-                all.add(category.alt_name)
-        return list(all)
+            if category.id in _ALT_NAMES:
+                all.add(_ALT_NAMES[category.id])
+        return tuple(sys.intern(name) for name in sorted(all))
     
-    elif archive_or_cat in CATEGORIES: #check for alternate names
-        cat=CATEGORIES[archive_or_cat]
-        if cat.alt_name: 
-            return [cat.id, cat.alt_name]
-        else:
-            return [cat.id]
+    cat=CATEGORIES[archive_or_cat] #check for alternate names
+    if cat.id in _ALT_NAMES: 
+        return (sys.intern(cat.id), _ALT_NAMES[cat.id])
     else:
-        raise BadRequest(f'Invalid category: {archive_or_cat}')
+        return (sys.intern(cat.id),)
+
+def _request_categories_for(archive_or_cat:str) -> Tuple[Tuple[str, ...],Tuple[Tuple[str,str], ...]]:
+    """walks the taxonomy for _request_categories, only run when building the lookup"""
+    if archive_or_cat in ARCHIVES:
+        arch, cats=process_requested_subject(ARCHIVES[archive_or_cat])
+    else:
+        arch, cats=process_requested_subject(CATEGORIES[archive_or_cat])
+    return (
+        tuple(sys.intern(name) for name in sorted(arch)),
+        tuple((sys.intern(arch_part), sys.intern(subj_part)) for arch_part, subj_part in sorted(cats))
+    )
 
+#the taxonomy is static so these are worked out once rather than on every request
+#names are interned so every request shares the same string objects
+_POSSIBLE_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    name: _possible_categories_for(name) for name in {*CATEGORIES, *ARCHIVES}
+}
+_REQUEST_CATEGORIES: Dict[str, Tuple[Tuple[str, ...],Tuple[Tuple[str,str], ...]]] = {
+    name: _request_categories_for(name) for name in {*CATEGORIES, *ARCHIVES}
+}
+
+#names for an archive that are not under its own prefix, aliases and subsumed archives
+_ARCHIVE_OTHER_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    name: tuple(cat for cat in _POSSIBLE_CATEGORIES[name] if not cat.startswith(f"{name}."))
+    for name in ARCHIVES
+}
+
+def _category_filter(category: Mapped[str], archive_or_cat: str) -> ColumnElement[bool]:
+    """matches every name from _all_possible_categories.
+    for an archive the names under it are matched by their fixed archive. prefix which can use the index,
+    only names outside the prefix are listed
+    """
+    category_list=_all_possible_categories(archive_or_cat)
+    if archive_or_cat not in ARCHIVES:
+        return category.in_(category_list)
+
+    in_archive=category.startswith(f"{archive_or_cat}.", autoescape=True)
+    others=_ARCHIVE_OTHER_CATEGORIES[archive_or_cat]
+    if not others:
+        return in_archive
+    return or_(in_archive, category.in_(others))
+
+
+_OLD_ID_ARCHIVES=sorted(ARCHIVES.keys())
+
+def _old_id_prefix(paper_id: Mapped[str], date_part: Union[str, BindParameter[str]]) -> ColumnElement[bool]:
+    """matches old style ids (archive/YYMMNNN) starting with the date part.
+    checks each archive as a prefix so the paper_id index can be used, a leading wildcard would scan the table
+    """
+    return or_(*[paper_id.startswith(f"{arch}/" + date_part) for arch in _OLD_ID_ARCHIVES])
 
 def get_yearly_article_counts(archive: str, year: int) -> YearCount:
+    """counts of new and cross listed articles for each month of the year
+    past years rarely change so they are recounted once a day, the current year every hour
+    the previous year is also recounted hourly through January while it is still settling
+    """
+    today=date.today() #same day as the year page controller
+    if year < today.year-1 or (year == today.year-1 and today.month > 1):
+        bucket=int(time.time() // 86400)
+    else:
+        bucket=int(time.time() // 3600)
+    return _cached_yearly_article_counts(archive, year, bucket)
 
+@lru_cache(maxsize=4096)
+def _cached_yearly_article_counts(archive: str, year: int, bucket: int) -> YearCount:
+    """bucket only separates cache entries, see get_yearly_article_counts"""
+    return _get_yearly_article_counts(archive, year)
+
+get_yearly_article_counts.cache_clear = _cached_yearly_article_counts.cache_clear # type: ignore[attr-defined]
+
+def _get_yearly_article_counts(archive: str, year: int) -> YearCount:
     aic = aliased(t_arXiv_in_category)
     doc = aliased(Document)
     archives, cats=_request_categories(archive)
     cat_conditions = [and_(aic.c.archive == arch_part, aic.c.subject_class == subj_part) for arch_part, subj_part in cats]
    
-    new_doc_ids=(
-        Session.query(
-            doc.document_id,
-            func.substr(doc.paper_id, 3, 2).label("month"),
+    #month follows the year in both YYMM.NNNNN and archive/YYMMNNN, instr is 0 for new ids
+    month=func.substr(doc.paper_id, func.instr(doc.paper_id, "/") + 3, 2)
+    if year > 2007: 
+        id_filter=doc.paper_id.startswith(f"{year % 100:02d}")
+    elif year < 2007: 
+        id_filter=_old_id_prefix(doc.paper_id, f"{year % 100:02d}")
+    else: #both styles present, one pass over the documents for both
+        id_filter=or_(
+            doc.paper_id.startswith(f"{year % 100:02d}"),
+            _old_id_prefix(doc.paper_id, f"{year % 100:02d}")
         )
-        .filter(doc.paper_id.startswith(f"{year % 100:02d}"))
-        .subquery()
-    )
-    old_doc_ids=(
+
+    doc_ids=(
         Session.query(
             doc.document_id,
-            func.substring(
-                func.substring_index(doc.paper_id, "/", -1), 3, 2
-            ).label("month")
+            month.label("month")
         )
-        .filter(doc.paper_id.like(f"%/{year % 100:02d}%"))
+        .filter(id_filter)
         .subquery()
     )
 
-    if year > 2007: 
-        doc_ids=new_doc_ids        
-    elif year < 2007: 
-        doc_ids=old_doc_ids
-    else: #both styles present
-        doc_ids=Session.query(
-            old_doc_ids.c.document_id.label("document_id"), 
-            old_doc_ids.c.month.label("month")
-            ).union_all(
-                Session.query(
-                    new_doc_ids.c.document_id.label("document_id"), 
-                    new_doc_ids.c.month.label("month")
-                )
-            ).subquery()
-         
+    #archives and categories are compared exactly, is_primary decides new or cross so abs_categories is never parsed
     subquery=(
         Session.query(
             doc_ids.c.month,
@@ -647,23 +739,18 @@ def get_yearly_article_counts(archive: str, year: int) -> YearCount:
 
 def _process_yearly_article_counts(query_result: List[Row], year: int) -> YearCount:
     """take entries found in metadata table for yearly totals and create YearCount of them"""
-    monthlist = []
-    # create empty months
-    for i in range(1, 13):
-        monthlist.append(MonthCount(year, i, 0, 0))
-    new_total = 0
-    cross_total = 0
-
+    #counts are gathered per month first, MonthCounts are only made once at the end
+    new_counts = [0] * 12
+    cross_counts = [0] * 12
     for entry in query_result:
         index = int(entry.month) - 1
-        monthlist[index].new = entry.count_new
-        monthlist[index].cross = entry.count_cross
-
-        new_total += entry.count_new
-        cross_total += entry.count_cross
+        new_counts[index] = entry.count_new
+        cross_counts[index] = entry.count_cross
 
-    data = YearCount(year, new_total, cross_total, monthlist)
-    return data
+    monthlist = [
+        MonthCount(year, i + 1, new_counts[i], cross_counts[i]) for i in range(12)
+    ]
+    return YearCount(year, sum(new_counts), sum(cross_counts), monthlist)
 
 def check_service() -> str:
     query=Session.query(Metadata).limit(1).all()
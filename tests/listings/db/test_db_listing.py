@@ -1,6 +1,11 @@
 from datetime import datetime
+import pytest
+from werkzeug.exceptions import BadRequest
+
 from browse.services.database.listings import (
     _all_possible_categories,
+    _ARCHIVE_OTHER_CATEGORIES,
+    _request_categories,
     _metadata_to_listing_item
 )
 from browse.services.listing import get_listing_service, NotModifiedResponse
@@ -53,7 +58,7 @@ def test_list_dl_links(client_with_db_listings):
 
 def test_possible_categories():
     
-    assert ["math.KT"]==_all_possible_categories("math.KT") #single category
+    assert ("math.KT",)==_all_possible_categories("math.KT") #single category
 
     #single category with different name
     assert "cs.SY" in _all_possible_categories("eess.SY")
@@ -70,6 +75,28 @@ def test_possible_categories():
     assert "astro-ph" in _all_possible_categories("astro-ph")
     assert "astro-ph.EP" in _all_possible_categories("astro-ph")
 
+def test_possible_categories_precomputed():
+    #same frozen answer every time
+    assert _all_possible_categories("math") is _all_possible_categories("math")
+    assert _request_categories("math") is _request_categories("math")
+
+    archives, cats=_request_categories("math")
+    assert "math" in archives
+    assert "dg-ga" in archives #subsumed archive
+
+    with pytest.raises(BadRequest):
+        _all_possible_categories("not-a-cat")
+    with pytest.raises(BadRequest):
+        _request_categories("not-a-cat")
+
+def test_archive_other_categories():
+    #only names outside the archive prefix are listed
+    assert "q-alg" in _ARCHIVE_OTHER_CATEGORIES["math"]
+    assert "stat.TH" in _ARCHIVE_OTHER_CATEGORIES["math"]
+    assert "math.GM" not in _ARCHIVE_OTHER_CATEGORIES["math"]
+    assert "nlin.CG" in _ARCHIVE_OTHER_CATEGORIES["comp-gas"]
+    assert "astro-ph" in _ARCHIVE_OTHER_CATEGORIES["astro-ph"]
+
 def test_not_modified(app_with_db):
     app = app_with_db
     with app.app_context():
@@ -1,4 +1,5 @@
 from datetime import datetime
+from types import SimpleNamespace
 
 from browse.services.database.listings import _entries_into_monthly_listing_items
 from browse.services.listing import get_listing_service
@@ -64,16 +65,31 @@ SAMPLE_METADATA2=Metadata(
     is_withdrawn = 0
 )
 
+LISTING_COLUMNS=["paper_id", "updated", "source_flags", "title", "authors", "abs_categories",
+    "comments", "journal_ref", "version", "modtime"]
+
+def _listing_row(meta, is_primary):
+    """shaped like a row of the monthly listing query"""
+    return SimpleNamespace(**{col: getattr(meta, col) for col in LISTING_COLUMNS}, is_primary=is_primary, total=2)
+
 #month listing tests
 
 def test_transform_into_listing():
-    items=[(SAMPLE_METADATA1,1),(SAMPLE_METADATA2,0)]
-    new, cross=_entries_into_monthly_listing_items(items)
-
-    assert len(new)==1 and len(cross)==1
-    assert new[0].id=="1234.5678" and cross[0].id=="1234.5679"
-    assert new[0].primary=="cs.CG" and cross[0].primary=="cs.LO"
-    assert new[0].article.arxiv_id_v=="1234.5678v1" and cross[0].article.arxiv_id_v=="1234.5679v1"
+    items=[_listing_row(SAMPLE_METADATA1,1),_listing_row(SAMPLE_METADATA2,0)]
+    listings=_entries_into_monthly_listing_items(items)
+
+    assert len(listings)==2
+    assert [i.listingType for i in listings]==["new","cross"]
+    assert [i.id for i in listings]==["1234.5678","1234.5679"] #query order is kept
+    new, cross=listings
+    assert new.id=="1234.5678" and cross.id=="1234.5679"
+    assert new.primary=="cs.CG" and cross.primary=="cs.LO"
+    assert new.article.arxiv_id_v=="1234.5678v1" and cross.article.arxiv_id_v=="1234.5679v1"
+    assert new.article.abstract=="" #not selected for monthly listings
+
+    reordered=_entries_into_monthly_listing_items(items[::-1])
+    assert [i.id for i in reordered]==["1234.5679","1234.5678"]
+    assert [i.listingType for i in reordered]==["cross","new"]
 
 def test_listings_for_month(app_with_db):
     app = app_with_db
@@ -112,6 +128,8 @@ def test_listings_for_month(app_with_db):
         assert items1.listings[1] not in items2.listings
         assert len(items1.listings)==2
         assert len(items2.listings)>=2
+        items3=ls.list_articles_by_month("math", 2009, 6, 1000,25)
+        assert items3.count==items1.count and len(items3.listings)==0
 
         #subsumed archives are found
         items=ls.list_articles_by_month('nlin.CD', 1995, 10, 0,25)
@@ -52,7 +52,8 @@ def test_get_yearly_article_counts(app_with_db):
     app = app_with_db
     with app.app_context():
         # pre id-swap
-        # TODO cant test old data on sqlite
+        old_ids = get_yearly_article_counts("ao-sci", 1995)
+        assert old_ids.by_month[9].cross >= 1  # chao-dyn/9510015
 
         # post id-swap
 
@@ -77,7 +78,33 @@ def test_get_yearly_article_counts(app_with_db):
         )  # this is dependedant in the data in the test databse not changing
 
         # 2007 mid id-swap
-        # TODO cant test early 2007 data on sqlite
+        both_ids = get_yearly_article_counts("hep-th", 2007)
+        assert both_ids.by_month[2].new >= 1  # hep-th/0703166
+
+        # archives are matched exactly, math-ph is not part of math
+        math_ph = get_yearly_article_counts("math-ph", 2009)
+        assert math_ph.by_month[5] == MonthCount(2009, 6, 0, 1)  # 0906.3421 is math.CO primary
+
+def test_yearly_article_counts_cached(app_with_db):
+    app = app_with_db
+    with app.app_context():
+        get_yearly_article_counts.cache_clear()
+        first = get_yearly_article_counts("cond-mat", 2009)
+        assert get_yearly_article_counts("cond-mat", 2009) is first #past years are kept for the day
+
+        get_yearly_article_counts.cache_clear()
+        again = get_yearly_article_counts("cond-mat", 2009)
+        assert again is not first
+        assert again == first
+
+        with patch("browse.services.database.listings.time") as mock_time:
+            mock_time.time.return_value = 86400 * 20000
+            day1 = get_yearly_article_counts("cond-mat", 2009)
+            mock_time.time.return_value = 86400 * 20000 + 3600
+            assert get_yearly_article_counts("cond-mat", 2009) is day1
+            mock_time.time.return_value = 86400 * 20001
+            assert get_yearly_article_counts("cond-mat", 2009) is not day1 #recounted the next day
+
 
 @patch("browse.services.listing.db_listings.get_yearly_article_counts")
 def test_year_page_db(mock, client_with_db_listings):